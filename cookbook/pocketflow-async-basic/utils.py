@@ -36,8 +36,8 @@ async def call_llm_async(prompt):
 
 async def get_user_input(prompt):
     """Get user input asynchronously."""
-    # Create event loop to handle async input
-    loop = asyncio.get_event_loop()
+    # Use the loop this coroutine is already running on
+    loop = asyncio.get_running_loop()
     
     # Get input in a non-blocking way
     answer = await loop.run_in_executor(None, input, prompt)
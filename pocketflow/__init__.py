@@ -1,4 +1,4 @@
-import asyncio, warnings, copy, time
+import asyncio, warnings, copy, time, random
 
 def _validate_port_contracts(src, tgt):
     """Validate that src.Output fields satisfy tgt.Input requirements at graph build time."""
@@ -58,14 +58,25 @@ class _ConditionalTransition:
     def __rshift__(self,tgt): return self.src.next(tgt,self.action)
 
 class Node(BaseNode):
-    def __init__(self,max_retries=1,wait=0): super().__init__(); self.max_retries,self.wait=max_retries,wait
+    def __init__(self,max_retries=1,wait=0,*,backoff=1,jitter=0,max_wait=None):
+        super().__init__()
+        if backoff<1: raise ValueError(f"backoff must be >= 1, got {backoff}")
+        if not 0<=jitter<=1: raise ValueError(f"jitter must be between 0 and 1, got {jitter}")
+        if max_wait is not None and max_wait<0: raise ValueError(f"max_wait must be >= 0 or None, got {max_wait}")
+        self.max_retries,self.wait,self.backoff,self.jitter,self.max_wait=max_retries,wait,backoff,jitter,max_wait
     def exec_fallback(self,prep_res,exc): raise exc
+    def _retry_wait(self,attempt):
+        try: w=self.wait*self.backoff**attempt
+        except OverflowError: w=float("inf")
+        if self.max_wait is not None: w=min(w,self.max_wait)
+        return w*random.uniform(1-self.jitter,1+self.jitter) if self.jitter else w
     def _exec(self,prep_res):
-        for self.cur_retry in range(self.max_retries):
+        for i in range(self.max_retries):
+            self.cur_retry=i
             try: return self.exec(prep_res)
             except Exception as e:
-                if self.cur_retry==self.max_retries-1: return self.exec_fallback(prep_res,e)
-                if self.wait>0: time.sleep(self.wait)
+                if i==self.max_retries-1: return self.exec_fallback(prep_res,e)
+                if self.wait>0: time.sleep(self._retry_wait(i))
 
 class BatchNode(Node):
     def _exec(self,items): return [super(BatchNode,self)._exec(i) for i in (items or [])]
@@ -96,11 +107,12 @@ class AsyncNode(Node):
     async def exec_fallback_async(self,prep_res,exc): raise exc
     async def post_async(self,shared,prep_res,exec_res): pass
     async def _exec(self,prep_res): 
-        for self.cur_retry in range(self.max_retries):
+        for i in range(self.max_retries):
+            self.cur_retry=i
             try: return await self.exec_async(prep_res)
             except Exception as e:
-                if self.cur_retry==self.max_retries-1: return await self.exec_fallback_async(prep_res,e)
-                if self.wait>0: await asyncio.sleep(self.wait)
+                if i==self.max_retries-1: return await self.exec_fallback_async(prep_res,e)
+                if self.wait>0: await asyncio.sleep(self._retry_wait(i))
     async def run_async(self,shared): 
         if self.successors: warnings.warn("Node won't run successors. Use AsyncFlow.")  
         return await self._run_async(shared)
@@ -108,17 +120,27 @@ class AsyncNode(Node):
     def _run(self,shared): raise RuntimeError("Use run_async.")
 
 class AsyncBatchNode(AsyncNode,BatchNode):
-    async def _exec(self,items): return [await super(AsyncBatchNode,self)._exec(i) for i in items]
+    async def _exec(self,items): return [await super(AsyncBatchNode,self)._exec(i) for i in (items or [])]
+
+def _check_max_concurrency(n):
+    if n is not None and n<1: raise ValueError(f"max_concurrency must be >= 1 or None, got {n}")
+    return n
+
+async def _bounded(sem,fn,*args):
+    if sem is None: return await fn(*args)
+    async with sem: return await fn(*args)
 
 class AsyncParallelBatchNode(AsyncNode,BatchNode):
-    def __init__(self,max_retries=1,wait=0,fail_fast=False):
-        super().__init__(max_retries=max_retries,wait=wait); self.fail_fast=fail_fast
+    def __init__(self,max_retries=1,wait=0,fail_fast=False,*,max_concurrency=None,backoff=1,jitter=0,max_wait=None):
+        super().__init__(max_retries=max_retries,wait=wait,backoff=backoff,jitter=jitter,max_wait=max_wait); self.fail_fast,self.max_concurrency=fail_fast,_check_max_concurrency(max_concurrency)
     async def _exec(self,items):
+        if not items: return []
+        sem,one=asyncio.Semaphore(self.max_concurrency) if self.max_concurrency is not None else None,super(AsyncParallelBatchNode,self)._exec
         if self.fail_fast:
             async with asyncio.TaskGroup() as tg:
-                tasks=[tg.create_task(super(AsyncParallelBatchNode,self)._exec(i)) for i in items]
+                tasks=[tg.create_task(_bounded(sem,one,i)) for i in items]
             return [t.result() for t in tasks]
-        return await asyncio.gather(*(super(AsyncParallelBatchNode,self)._exec(i) for i in items))
+        return await asyncio.gather(*(_bounded(sem,one,i) for i in items))
 
 class AsyncFlow(Flow,AsyncNode):
     async def _orch_async(self,shared,params=None):
@@ -135,13 +157,14 @@ class AsyncBatchFlow(AsyncFlow,BatchFlow):
         return await self.post_async(shared,pr,None)
 
 class AsyncParallelBatchFlow(AsyncFlow,BatchFlow):
-    def __init__(self,start=None,fail_fast=False):
-        super().__init__(start=start); self.fail_fast=fail_fast
+    def __init__(self,start=None,fail_fast=False,*,max_concurrency=None):
+        super().__init__(start=start); self.fail_fast,self.max_concurrency=fail_fast,_check_max_concurrency(max_concurrency)
     async def _run_async(self,shared): 
         pr=await self.prep_async(shared) or []
+        sem=asyncio.Semaphore(self.max_concurrency) if self.max_concurrency is not None else None
         if self.fail_fast:
             async with asyncio.TaskGroup() as tg:
-                for bp in pr: tg.create_task(self._orch_async(shared,{**self.params,**bp}))
+                for bp in pr: tg.create_task(_bounded(sem,self._orch_async,shared,{**self.params,**bp}))
         else:
-            await asyncio.gather(*(self._orch_async(shared,{**self.params,**bp}) for bp in pr))
+            await asyncio.gather(*(_bounded(sem,self._orch_async,shared,{**self.params,**bp}) for bp in pr))
         return await self.post_async(shared,pr,None)
@@ -37,10 +37,14 @@ class _ConditionalTransition:
 class Node(BaseNode[_PrepResult, _ExecResult, _PostResult]):
     max_retries: int
     wait: Union[int, float]
+    backoff: Union[int, float]
+    jitter: float
+    max_wait: Optional[Union[int, float]]
     cur_retry: int
     
-    def __init__(self, max_retries: int = 1, wait: Union[int, float] = 0) -> None: ...
+    def __init__(self, max_retries: int = 1, wait: Union[int, float] = 0, *, backoff: Union[int, float] = 1, jitter: float = 0, max_wait: Optional[Union[int, float]] = None) -> None: ...
     def exec_fallback(self, prep_res: _PrepResult, exc: Exception) -> _ExecResult: ...
+    def _retry_wait(self, attempt: int) -> float: ...
     def _exec(self, prep_res: _PrepResult) -> _ExecResult: ...
 
 class BatchNode(Node[Optional[List[_PrepResult]], List[_ExecResult], _PostResult]):
@@ -80,7 +84,8 @@ class AsyncBatchNode(AsyncNode[Optional[List[_PrepResult]], List[_ExecResult], _
 
 class AsyncParallelBatchNode(AsyncNode[Optional[List[_PrepResult]], List[_ExecResult], _PostResult], BatchNode[Optional[List[_PrepResult]], List[_ExecResult], _PostResult]):
     fail_fast: bool
-    def __init__(self, max_retries: int = 1, wait: Union[int, float] = 0, fail_fast: bool = False) -> None: ...
+    max_concurrency: Optional[int]
+    def __init__(self, max_retries: int = 1, wait: Union[int, float] = 0, fail_fast: bool = False, *, max_concurrency: Optional[int] = None, backoff: Union[int, float] = 1, jitter: float = 0, max_wait: Optional[Union[int, float]] = None) -> None: ...
     async def _exec(self, items: Optional[List[_PrepResult]]) -> List[_ExecResult]: ...
 
 class AsyncFlow(Flow[_PrepResult, Any, _PostResult], AsyncNode[_PrepResult, Any, _PostResult]):
@@ -97,5 +102,6 @@ class AsyncBatchFlow(AsyncFlow[Optional[List[Params]], Any, _PostResult], BatchF
 
 class AsyncParallelBatchFlow(AsyncFlow[Optional[List[Params]], Any, _PostResult], BatchFlow[Optional[List[Params]], Any, _PostResult]):
     fail_fast: bool
-    def __init__(self, start: Optional[BaseNode[Any, Any, Any]] = None, fail_fast: bool = False) -> None: ...
+    max_concurrency: Optional[int]
+    def __init__(self, start: Optional[BaseNode[Any, Any, Any]] = None, fail_fast: bool = False, *, max_concurrency: Optional[int] = None) -> None: ...
     async def _run_async(self, shared: SharedData) -> _PostResult: ...
@@ -53,7 +53,19 @@ class TestAsyncBatchNode(unittest.TestCase):
         
         results = shared_storage['chunk_results']
         self.assertEqual(results, [45, 145, 110])  # Sum of chunks [0-9], [10-19], [20-24]
-        
+
+    def test_none_prep_result(self):
+        """
+        Test that a prep result of None is treated as an empty batch
+        """
+        class NoneChunkNode(AsyncArrayChunkNode):
+            async def prep_async(self, shared_storage):
+                return None
+
+        shared_storage = {}
+        asyncio.run(NoneChunkNode().run_async(shared_storage))
+        self.assertEqual(shared_storage['chunk_results'], [])
+
     # def test_async_map_reduce_sum(self):
     #     """
     #     Test a complete async map-reduce pipeline that sums a large array:
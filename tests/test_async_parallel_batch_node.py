@@ -68,7 +68,23 @@ class TestAsyncParallelBatchNode(unittest.TestCase):
         self.loop.run_until_complete(processor.run_async(shared_storage))
         
         self.assertEqual(shared_storage['processed_numbers'], [])
-    
+
+    def test_none_input(self):
+        """
+        Test that a prep result of None short-circuits to an empty result
+        """
+        class NoneProcessor(AsyncParallelNumberProcessor):
+            async def prep_async(self, shared_storage):
+                return None
+
+        for fail_fast in (False, True):
+            with self.subTest(fail_fast=fail_fast):
+                shared_storage = {}
+                processor = NoneProcessor()
+                processor.fail_fast = fail_fast
+                self.loop.run_until_complete(processor.run_async(shared_storage))
+                self.assertEqual(shared_storage['processed_numbers'], [])
+
     def test_single_item(self):
         """
         Test processing of a single item
@@ -0,0 +1,120 @@
+import asyncio
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pocketflow import AsyncNode, AsyncParallelBatchFlow, AsyncParallelBatchNode
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def hold(self, delay):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.active -= 1
+
+
+class TrackedParallelNode(AsyncParallelBatchNode):
+    def __init__(self, tracker, **kwargs):
+        super().__init__(**kwargs)
+        self.tracker = tracker
+
+    async def prep_async(self, shared):
+        return shared["items"]
+
+    async def exec_async(self, item):
+        await self.tracker.hold(0.02)
+        return item * 10
+
+    async def post_async(self, shared, prep_res, exec_res):
+        shared["results"] = exec_res
+        return "done"
+
+
+class TrackedWorkerNode(AsyncNode):
+    def __init__(self, tracker):
+        super().__init__()
+        self.tracker = tracker
+
+    async def prep_async(self, shared):
+        return self.params["item"]
+
+    async def exec_async(self, item):
+        await self.tracker.hold(0.02)
+        return item * 10
+
+    async def post_async(self, shared, prep_res, exec_res):
+        shared.setdefault("results", {})[prep_res] = exec_res
+
+
+class TrackedParallelFlow(AsyncParallelBatchFlow):
+    async def prep_async(self, shared):
+        return [{"item": item} for item in shared["items"]]
+
+
+@pytest.mark.asyncio
+async def test_async_parallel_batch_node_default_is_unbounded():
+    tracker = ConcurrencyTracker()
+    node = TrackedParallelNode(tracker)
+    shared = {"items": list(range(6))}
+
+    await node.run_async(shared)
+
+    assert node.max_concurrency is None
+    assert tracker.peak == 6
+    assert shared["results"] == [0, 10, 20, 30, 40, 50]
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+@pytest.mark.asyncio
+async def test_async_parallel_batch_node_respects_max_concurrency(fail_fast):
+    tracker = ConcurrencyTracker()
+    node = TrackedParallelNode(tracker, max_concurrency=2, fail_fast=fail_fast)
+    shared = {"items": list(range(6))}
+
+    await node.run_async(shared)
+
+    assert tracker.peak == 2
+    assert shared["results"] == [0, 10, 20, 30, 40, 50]
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+@pytest.mark.asyncio
+async def test_async_parallel_batch_flow_respects_max_concurrency(fail_fast):
+    tracker = ConcurrencyTracker()
+    flow = TrackedParallelFlow(start=TrackedWorkerNode(tracker), max_concurrency=3, fail_fast=fail_fast)
+    shared = {"items": list(range(7))}
+
+    await flow.run_async(shared)
+
+    assert tracker.peak == 3
+    assert shared["results"] == {i: i * 10 for i in range(7)}
+
+
+@pytest.mark.parametrize("bad", [0, -1])
+def test_max_concurrency_below_one_is_rejected(bad):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        AsyncParallelBatchNode(max_concurrency=bad)
+    with pytest.raises(ValueError, match="max_concurrency"):
+        AsyncParallelBatchFlow(max_concurrency=bad)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_one_runs_items_serially():
+    tracker = ConcurrencyTracker()
+    node = TrackedParallelNode(tracker, max_concurrency=1)
+    shared = {"items": list(range(4))}
+
+    await node.run_async(shared)
+
+    assert tracker.peak == 1
+    assert shared["results"] == [0, 10, 20, 30]
@@ -0,0 +1,239 @@
+import asyncio
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pocketflow
+from pocketflow import AsyncNode, AsyncParallelBatchNode, Node
+
+_real_sleep = asyncio.sleep
+
+
+class FlakyNode(Node):
+    def __init__(self, fail_times, **kwargs):
+        super().__init__(**kwargs)
+        self.fail_times = fail_times
+        self.calls = 0
+
+    def prep(self, shared):
+        return shared["query"]
+
+    def exec(self, query):
+        self.calls += 1
+        if self.calls <= self.fail_times:
+            raise ValueError("rate limited")
+        return f"ok:{query}"
+
+    def exec_fallback(self, query, exc):
+        return f"fallback:{query}"
+
+    def post(self, shared, prep_res, exec_res):
+        shared["result"] = exec_res
+
+
+class AsyncFlakyNode(AsyncNode):
+    def __init__(self, fail_times, **kwargs):
+        super().__init__(**kwargs)
+        self.fail_times = fail_times
+        self.calls = 0
+
+    async def prep_async(self, shared):
+        return shared["query"]
+
+    async def exec_async(self, query):
+        self.calls += 1
+        if self.calls <= self.fail_times:
+            raise ValueError("rate limited")
+        return f"ok:{query}"
+
+    async def post_async(self, shared, prep_res, exec_res):
+        shared["result"] = exec_res
+
+
+class StaggeredParallelNode(AsyncParallelBatchNode):
+    """Each item fails `fail_times[item]` times; slow items take a real delay before failing."""
+
+    def __init__(self, fail_times, slow, **kwargs):
+        super().__init__(**kwargs)
+        self.fail_times = fail_times
+        self.slow = slow
+        self.calls = {item: 0 for item in fail_times}
+        self.task_items = {}
+
+    async def prep_async(self, shared):
+        return shared["items"]
+
+    async def exec_async(self, item):
+        self.task_items[asyncio.current_task()] = item
+        self.calls[item] += 1
+        if item in self.slow:
+            await _real_sleep(0.02)
+        if self.calls[item] <= self.fail_times[item]:
+            raise ValueError(f"rate limited {item}")
+        return f"ok:{item}"
+
+    async def exec_fallback_async(self, item, exc):
+        return f"fallback:{item}"
+
+    async def post_async(self, shared, prep_res, exec_res):
+        shared["results"] = exec_res
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(pocketflow.time, "sleep", recorded.append)
+
+    async def fake_sleep(delay):
+        recorded.append((asyncio.current_task(), delay))
+        await _real_sleep(0)
+
+    monkeypatch.setattr(pocketflow.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def test_default_wait_is_constant(sleeps):
+    shared = {"query": "q"}
+    FlakyNode(fail_times=3, max_retries=4, wait=0.5).run(shared)
+    assert shared["result"] == "ok:q"
+    assert sleeps == [0.5, 0.5, 0.5]
+
+
+def test_backoff_grows_wait_exponentially(sleeps):
+    shared = {"query": "q"}
+    FlakyNode(fail_times=3, max_retries=4, wait=1, backoff=2).run(shared)
+    assert shared["result"] == "ok:q"
+    assert sleeps == [1, 2, 4]
+
+
+def test_no_wait_after_final_attempt(sleeps):
+    shared = {"query": "q"}
+    FlakyNode(fail_times=5, max_retries=3, wait=1, backoff=3).run(shared)
+    assert shared["result"] == "fallback:q"
+    assert sleeps == [1, 3]
+
+
+def test_max_wait_caps_each_wait(sleeps):
+    shared = {"query": "q"}
+    FlakyNode(fail_times=9, max_retries=10, wait=1, backoff=2, max_wait=30).run(shared)
+    assert shared["result"] == "ok:q"
+    assert sleeps == [1, 2, 4, 8, 16, 30, 30, 30, 30]
+
+
+def test_jitter_stays_within_bounds(sleeps):
+    shared = {"query": "q"}
+    FlakyNode(fail_times=50, max_retries=51, wait=1, jitter=0.25).run(shared)
+    assert shared["result"] == "ok:q"
+    assert len(sleeps) == 50
+    assert all(0.75 <= s <= 1.25 for s in sleeps)
+    assert len(set(sleeps)) > 1
+
+
+def test_full_jitter_never_sleeps_negative(sleeps):
+    shared = {"query": "q"}
+    FlakyNode(fail_times=50, max_retries=51, wait=1, backoff=2, jitter=1, max_wait=1.5).run(shared)
+    assert shared["result"] == "ok:q"
+    assert all(0 <= s <= 3 for s in sleeps)
+
+
+def test_jitter_still_spreads_waits_at_the_cap(sleeps):
+    shared = {"query": "q"}
+    FlakyNode(fail_times=30, max_retries=31, wait=1, backoff=2, jitter=0.25, max_wait=10).run(shared)
+    assert shared["result"] == "ok:q"
+    for n, s in enumerate(sleeps[:4]):
+        assert 0.75 * 2**n <= s <= 1.25 * 2**n
+    capped = sleeps[4:]
+    assert len(capped) == 26
+    assert all(7.5 <= s <= 12.5 for s in capped)
+    assert len(set(capped)) > 1
+
+
+def test_async_jitter_still_spreads_waits_at_the_cap(sleeps):
+    shared = {"query": "q"}
+    node = AsyncFlakyNode(fail_times=20, max_retries=21, wait=1, backoff=3, jitter=0.5, max_wait=5)
+    asyncio.run(node.run_async(shared))
+    assert shared["result"] == "ok:q"
+    capped = [delay for _, delay in sleeps][2:]
+    assert all(2.5 <= s <= 7.5 for s in capped)
+    assert len(set(capped)) > 1
+
+
+@pytest.mark.parametrize("wait, backoff, max_retries", [
+    (1, 10.0, 400),
+    (0.01, 2, 1100),
+])
+def test_large_max_retries_does_not_overflow(sleeps, wait, backoff, max_retries):
+    shared = {"query": "q"}
+    FlakyNode(fail_times=max_retries + 1, max_retries=max_retries, wait=wait, backoff=backoff, max_wait=30).run(shared)
+    assert shared["result"] == "fallback:q"
+    assert len(sleeps) == max_retries - 1
+    assert max(sleeps) == 30
+
+
+def test_large_max_retries_does_not_overflow_with_jitter(sleeps):
+    shared = {"query": "q"}
+    FlakyNode(fail_times=500, max_retries=400, wait=1, backoff=10.0, jitter=0.2, max_wait=30).run(shared)
+    assert shared["result"] == "fallback:q"
+    assert all(s <= 36 for s in sleeps)
+
+
+def test_async_node_uses_backoff(sleeps):
+    shared = {"query": "q"}
+    asyncio.run(AsyncFlakyNode(fail_times=2, max_retries=3, wait=0.1, backoff=10).run_async(shared))
+    assert shared["result"] == "ok:q"
+    assert [delay for _, delay in sleeps] == pytest.approx([0.1, 1.0])
+
+
+def test_parallel_batch_items_back_off_independently(sleeps):
+    node = StaggeredParallelNode(
+        fail_times={"fast": 3, "slow": 2}, slow={"slow"},
+        max_retries=8, wait=1, backoff=10,
+    )
+    shared = {"items": ["fast", "slow"]}
+
+    asyncio.run(node.run_async(shared))
+
+    assert shared["results"] == ["ok:fast", "ok:slow"]
+    assert node.calls == {"fast": 4, "slow": 3}
+    waits = {"fast": [], "slow": []}
+    for task, delay in sleeps:
+        waits[node.task_items[task]].append(delay)
+    assert waits == {"fast": [1, 10, 100], "slow": [1, 10]}
+
+
+def test_parallel_batch_items_fall_back_on_their_own_last_attempt(sleeps):
+    node = StaggeredParallelNode(
+        fail_times={"fast": 10, "slow": 10}, slow={"slow"},
+        max_retries=4, wait=1,
+    )
+    shared = {"items": ["fast", "slow"]}
+
+    asyncio.run(node.run_async(shared))
+
+    assert shared["results"] == ["fallback:fast", "fallback:slow"]
+    assert node.calls == {"fast": 4, "slow": 4}
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"backoff": 0.5},
+    {"jitter": -0.1},
+    {"jitter": 1.5},
+    {"max_wait": -1},
+])
+def test_invalid_retry_parameters_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        Node(**kwargs)
+    with pytest.raises(ValueError):
+        AsyncParallelBatchNode(**kwargs)
+
+
+def test_new_retry_parameters_are_keyword_only():
+    with pytest.raises(TypeError):
+        Node(3, 1, 2)
+    with pytest.raises(TypeError):
+        AsyncParallelBatchNode(3, 1, False, 4)
+    node = AsyncParallelBatchNode(3, 1, True, backoff=2)
+    assert (node.max_retries, node.wait, node.fail_fast, node.backoff) == (3, 1, True, 2)